@@ -15,12 +15,41 @@ should be parsed in the unit tests below.
 #
 
 
+import functools
+import re
+import sys
 from typing import List, Union, Dict
 
 SSMLNode = Union["SSMLText", "SSMLTag"]
 
+# Single-pass tables for XML entity escaping/unescaping
+_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+_UNESCAPE_RE = re.compile(r'&(lt|gt|amp);')
+_UNESCAPE_MAP = {'lt': '<', 'gt': '>', 'amp': '&'}
+
+# Only short strings that contain special characters are memoized: short
+# text runs such as "Q&amp;A" when parsing, and attribute values or short
+# text when serializing, recur across a document. Long body text is mostly
+# unique and would only be kept alive by the cache.
+_CACHEABLE_LEN = 64
+
+# The tag name must end at whitespace, '/' or '>': a word boundary would
+# also accept name characters such as '-', ':' and '.' after "speak"
+_SPEAK_OPEN = re.compile(r'<speak(?=[\s/>])([^>]*)>', re.IGNORECASE)
+_SPEAK_CLOSE = re.compile(r'</speak\s*>', re.IGNORECASE)
+
+_ATTR_NAME_RE = re.compile(r'[\w.:\-]+')
+
+# One attribute: name = "value" | 'value' | value. Inside quotes an entity
+# ("&...;") is skipped as a unit, so a quote within it does not end the value.
+# Quoted values are matched as runs of plain characters separated by
+# entities, so the common entity-free value is consumed in a single step.
+_ATTR_RE = re.compile(r'''\s*([\w.:\-]+)\s*=\s*(?:"([^"&]*(?:&[^;]*;[^"&]*)*)"|'([^'&]*(?:&[^;]*;[^'&]*)*)'|([^\s>"'][^\s>]*))''')
+
 
 class SSMLTag:
+    __slots__ = ('name', 'attributes', 'children')
+    
     def __init__(self, name: str, attributes: Dict[str, str] = None, children: List[SSMLNode] = None):
         self.name = name
         self.attributes = attributes or {}
@@ -35,6 +64,8 @@ class SSMLTag:
 
 
 class SSMLText:
+    __slots__ = ('text',)
+    
     def __init__(self, text: str):
         self.text = text
         
@@ -45,129 +76,128 @@ class SSMLText:
 
 
 def parse_attributes(attr_string: str) -> Dict[str, str]:
-    import re
     attrs = {}
-    i = 0
+    pos = 0
     n = len(attr_string)
     
-    while i < n:
-        # Skip whitespace
-        while i < n and attr_string[i].isspace():
-            i += 1
-        if i >= n:
+    while pos < n:
+        # Anchor each match where the previous attribute ended; a search
+        # would retry from every later offset when the input is malformed
+        m = _ATTR_RE.match(attr_string, pos)
+        if m is None:
             break
-            
-        # Find attribute name
-        name_start = i
-        while i < n and (attr_string[i].isalnum() or attr_string[i] in '-_.:'):
-            i += 1
-        if i == name_start:
-            # No valid attribute name found
-            raise Exception(f"Invalid attribute at position {i}")
-            
-        name = attr_string[name_start:i]
-        
-        # Skip whitespace before =
-        while i < n and attr_string[i].isspace():
-            i += 1
-            
-        # Expect = after attribute name
-        if i >= n or attr_string[i] != '=':
-            raise Exception(f"Expected '=' after attribute name '{name}'")
-        i += 1
-        
-        # Skip whitespace after =
-        while i < n and attr_string[i].isspace():
-            i += 1
-            
-        # Get attribute value
-        if i >= n:
-            raise Exception(f"Expected attribute value after '=' for attribute '{name}'")
-            
-        quote = attr_string[i]
-        if quote not in ('"', "'"):
-            # Unquoted attribute value (not allowed in strict XML, but we'll handle it)
-            value_start = i
-            while i < n and not attr_string[i].isspace() and attr_string[i] != '>':
-                i += 1
-            value = attr_string[value_start:i]
+        name, double_quoted, single_quoted, unquoted = m.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted
         else:
-            # Quoted attribute value
-            i += 1  # Skip opening quote
-            value_start = i
-            while i < n and attr_string[i] != quote:
-                if attr_string[i] == '&':
-                    # Handle XML entities (simplified)
-                    i += 1
-                    while i < n and attr_string[i] != ';':
-                        i += 1
-                    if i >= n:
-                        break
-                i += 1
-                
-            if i >= n or attr_string[i] != quote:
-                raise Exception(f"Unclosed quote in attribute value for '{name}'")
-                
-            value = attr_string[value_start:i]
-            i += 1  # Skip closing quote
-        
-        attrs[name] = value
+            # Unquoted attribute value (not allowed in strict XML, but we'll handle it)
+            value = unquoted
+        attrs[sys.intern(name)] = value
+        pos = m.end()
+    
+    # Anything left over must be whitespace
+    if pos < n and not attr_string[pos:].isspace():
+        raise _attribute_error(attr_string, pos)
     
     return attrs
 
 
+def _attribute_error(attr_string: str, pos: int) -> Exception:
+    # Only reached on malformed input: work out which part of the attribute
+    # starting at `pos` is wrong so the message stays specific
+    n = len(attr_string)
+    while pos < n and attr_string[pos].isspace():
+        pos += 1
+    name_match = _ATTR_NAME_RE.match(attr_string, pos)
+    if not name_match:
+        return Exception(f"Invalid attribute at position {pos}")
+    name = name_match.group()
+    pos = name_match.end()
+    while pos < n and attr_string[pos].isspace():
+        pos += 1
+    if pos >= n or attr_string[pos] != '=':
+        return Exception(f"Expected '=' after attribute name '{name}'")
+    pos += 1
+    while pos < n and attr_string[pos].isspace():
+        pos += 1
+    if pos >= n:
+        return Exception(f"Expected attribute value after '=' for attribute '{name}'")
+    if attr_string[pos] == '>':
+        # An unquoted value stops at '>', so the value is empty and the '>'
+        # is where the next attribute would have to start
+        return Exception(f"Invalid attribute at position {pos}")
+    return Exception(f"Unclosed quote in attribute value for '{name}'")
+
+
 def parseSSML(ssml: str) -> SSMLNode:
-    def parse_node(s: str, pos: int, expected_closing_tag: str = None) -> tuple[list[SSMLNode], int]:
-        nodes = []
-        i = pos
-        text_buffer = []
+    def parse_node(s: str) -> list[SSMLNode]:
+        # Open elements are kept on an explicit stack instead of recursing
+        # per nesting level; the tags themselves serve as the frames
+        root = []
+        stack = []
+        nodes = root
+        i = 0
+        n = len(s)
+        # Bind globals and bound methods used per tag/text run as locals
+        find = s.find
+        startswith = s.startswith
+        intern = sys.intern
+        make_tag = SSMLTag
+        make_text = SSMLText
+        unescape = unescapeXMLChars
         
-        while i < len(s):
+        while i < n:
             if s[i] == '<':
-                # Handle text content before the tag
-                if text_buffer:
-                    text = ''.join(text_buffer)
-                    if text.strip():
-                        nodes.append(SSMLText(unescapeXMLChars(text)))
-                    text_buffer = []
-                
                 # Handle closing tag
-                if s.startswith('</', i):
-                    end_tag = s.find('>', i)
+                if startswith('</', i):
+                    end_tag = find('>', i)
                     if end_tag == -1:
                         raise Exception("Unclosed tag")
                     
                     # Extract tag name from closing tag (handle whitespace)
-                    tag_content = s[i+2:end_tag].strip()
-                    closing_tag = tag_content.strip().lower()
+                    closing_tag = s[i+2:end_tag].strip().lower()
                     
                     # Validate closing tag matches expected
+                    expected_closing_tag = stack[-1].name if stack else None
                     if expected_closing_tag and closing_tag != expected_closing_tag:
                         raise Exception(f"Mismatched tags: expected </{expected_closing_tag}>, got </{closing_tag}>")
                     
-                    return nodes, end_tag + 1
+                    i = end_tag + 1
+                    if not stack:
+                        # A closing tag outside any element ends the content
+                        break
+                    stack.pop()
+                    nodes = stack[-1].children if stack else root
+                    continue
                 
                 # Handle opening tag
-                tag_end = s.find('>', i)
+                tag_end = find('>', i)
                 if tag_end == -1:
                     raise Exception("Unclosed tag")
                 
-                # Parse tag content (handle whitespace)
-                tag_content = s[i+1:tag_end].strip()
+                # Parse tag content (handle whitespace): split() below already
+                # ignores leading whitespace and whitespace before a
+                # self-closing '/'
+                tag_content = s[i+1:tag_end].rstrip()
                 is_self_closing = tag_content.endswith('/')
                 if is_self_closing:
-                    tag_content = tag_content[:-1].strip()
+                    tag_content = tag_content[:-1]
                 
                 # Split tag name and attributes (handle whitespace)
-                parts = tag_content.strip().split(None, 1)
+                parts = tag_content.split(None, 1)
                 if not parts:
                     raise Exception("Empty tag")
                     
-                tag_name = parts[0].lower()
+                # Intern tag names: documents reuse a handful of them and
+                # equal names then share one string object
+                tag_name = intern(parts[0].lower())
                 attr_str = parts[1] if len(parts) > 1 else ""
                 
-                # Parse attributes
-                attributes = {}
+                # Parse attributes (SSMLTag allocates the empty dict/list
+                # itself, so none are created here just to be replaced)
+                attributes = None
                 if attr_str:
                     try:
                         attributes = parse_attributes(attr_str)
@@ -176,62 +206,53 @@ def parseSSML(ssml: str) -> SSMLNode:
                 
                 # Handle self-closing tag
                 if is_self_closing:
-                    nodes.append(SSMLTag(tag_name, attributes, []))
+                    nodes.append(make_tag(tag_name, attributes))
                     i = tag_end + 1
                     continue
                 
-                # Parse children recursively
-                children, new_pos = parse_node(s, tag_end + 1, tag_name)
-                nodes.append(SSMLTag(tag_name, attributes, children))
-                i = new_pos
+                # Collect children into this tag until its closing tag
+                tag = make_tag(tag_name, attributes)
+                nodes.append(tag)
+                stack.append(tag)
+                nodes = tag.children
+                i = tag_end + 1
                 
             else:
-                text_buffer.append(s[i])
-                i += 1
-        
-        # Add any remaining text
-        if text_buffer:
-            text = ''.join(text_buffer)
-            if text.strip():
-                nodes.append(SSMLText(unescapeXMLChars(text)))
+                # Consume the whole text run up to the next tag in one slice
+                next_lt = find('<', i)
+                if next_lt == -1:
+                    next_lt = n
+                text = s[i:next_lt]
+                if text and not text.isspace():
+                    nodes.append(make_text(unescape(text)))
+                i = next_lt
         
         # If we were expecting a closing tag but didn't find it
-        if expected_closing_tag:
-            raise Exception(f"Missing closing tag </{expected_closing_tag}>")
+        if stack:
+            raise Exception(f"Missing closing tag </{stack[-1].name}>")
             
-        return nodes, i
+        return root
     
     # Remove any leading/trailing whitespace
     ssml = ssml.strip()
     
-    # Check for root <speak> tag (case insensitive and with whitespace)
-    ssml_lower = ssml.lower()
-    if not (ssml_lower.lstrip().startswith('<speak') and '</speak>' in ssml_lower):
+    # Check for root <speak> tag (case insensitive, matched in place rather
+    # than on a lowercased copy of the whole document). The document must
+    # start with the opening tag and end with the closing one, which begins
+    # at the last '<'.
+    speak_open = _SPEAK_OPEN.match(ssml)
+    speak_close = _SPEAK_CLOSE.fullmatch(ssml, max(ssml.rfind('<'), 0))
+    if not (speak_open and speak_close):
         raise Exception("SSML must be wrapped in a <speak> tag")
     
     try:
-        # Find the actual end of the opening speak tag
-        speak_start = ssml_lower.find('<speak')
-        speak_end = ssml.find('>', speak_start)
-        if speak_end == -1:
-            raise Exception("Invalid SSML: unclosed <speak> tag")
-        
-        # Parse the content between <speak> and </speak>
-        content_start = speak_end + 1
-        content_end = ssml_lower.rfind('</speak>')
-        if content_end == -1:
-            raise Exception("Invalid SSML: missing closing </speak> tag")
-        
-        # Extract the content and parse it
-        content = ssml[content_start:content_end].strip()
-        nodes, _ = parse_node(content, 0)
+        # Extract the content between <speak> and </speak> and parse it
+        content = ssml[speak_open.end():speak_close.start()].strip()
+        nodes = parse_node(content)
         
         # Create the root speak tag with the parsed content
-        speak_attrs = {}
-        if ' ' in ssml[speak_start:speak_end]:
-            # Extract attributes from the speak tag
-            attr_str = ssml[speak_start + 6:speak_end].strip()
-            speak_attrs = parse_attributes(attr_str) if attr_str else {}
+        attr_str = speak_open.group(1).rstrip('/').strip()
+        speak_attrs = parse_attributes(attr_str) if attr_str else {}
         
         return SSMLTag('speak', speak_attrs, nodes)
         
@@ -239,35 +260,106 @@ def parseSSML(ssml: str) -> SSMLNode:
         raise Exception(f"Error parsing SSML: {str(e)}")
 
 def ssmlNodeToText(node: SSMLNode) -> str:
-    if isinstance(node, SSMLText):
-        return escapeXMLChars(node.text)
-    elif isinstance(node, SSMLTag):
-        # Build attributes string
-        attrs = ""
-        if node.attributes:
-            attrs = " " + " ".join(f'{k}="{escapeXMLChars(str(v))}"' for k, v in node.attributes.items())
-        
-        # Handle self-closing tags (no children and no text content)
-        if not node.children:
-            return f"<{node.name}{attrs} />"
-        
-        # Handle elements with children
-        children = "".join(ssmlNodeToText(child) for child in node.children)
-        
-        # If children is empty after processing, make it self-closing
-        if not children.strip():
-            return f"<{node.name}{attrs} />"
+    # All fragments go into one list that is joined once, instead of
+    # building and concatenating a string per node
+    out = []
+    _emit(node, out)
+    return "".join(out)
+
+
+def _emit(node: SSMLNode, out: List[str]) -> None:
+    # Appends the text for `node` to `out`. Open elements are kept on an
+    # explicit stack of [tag, children iterator, open_end, has_content]
+    # frames, as in parse_node, so deep trees don't recurse per level.
+    stack = []
+    done = object()
+    while True:
+        # `wrote` says whether `node` produced anything other than whitespace;
+        # it stays False for a tag whose children are still to be emitted
+        wrote = False
+        if isinstance(node, SSMLText):
+            text = escapeXMLChars(node.text)
+            out.append(text)
+            wrote = bool(text) and not text.isspace()
+        elif isinstance(node, SSMLTag):
+            # Opening tag and attributes
+            out.append("<")
+            out.append(node.name)
+            for k, v in node.attributes.items():
+                out.append(" ")
+                out.append(k)
+                out.append('="')
+                out.append(escapeXMLChars(str(v)))
+                out.append('"')
             
-        return f"<{node.name}{attrs}>{children}</{node.name}>"
-    return ""
+            # Handle self-closing tags (no children and no text content)
+            if not node.children:
+                out.append(" />")
+                wrote = True
+            else:
+                # Handle elements with children
+                stack.append([node, iter(node.children), len(out), False])
+                out.append(">")
+        
+        # Move on to the next child, closing every element that has run out
+        while stack:
+            frame = stack[-1]
+            if wrote:
+                frame[3] = True
+            child = next(frame[1], done)
+            if child is not done:
+                node = child
+                break
+            stack.pop()
+            tag, _, open_end, has_content = frame
+            if has_content:
+                out.append("</")
+                out.append(tag.name)
+                out.append(">")
+            else:
+                # If children is empty after processing, make it self-closing
+                del out[open_end:]
+                out.append(" />")
+            wrote = True
+        else:
+            return
+
+
+def _unescape_entities(text: str) -> str:
+    return _UNESCAPE_RE.sub(lambda m: _UNESCAPE_MAP[m.group(1)], text)
+
+
+def _escape_special(text: str) -> str:
+    return text.translate(_ESCAPE_TABLE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_unescape_entities(text: str) -> str:
+    return _unescape_entities(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_escape_special(text: str) -> str:
+    return _escape_special(text)
 
 
 def unescapeXMLChars(text: str) -> str:
-    return text.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
+    # Most text runs contain no entities at all
+    if '&' not in text:
+        return text
+    if len(text) <= _CACHEABLE_LEN:
+        return _cached_unescape_entities(text)
+    return _unescape_entities(text)
 
 
 def escapeXMLChars(text: str) -> str:
-    return text.replace("<", "&lt;").replace(">", "&gt;").replace("&", "&amp;")
+    # Plain text needs no escaping; the containment checks are much cheaper
+    # than a translate pass, especially for non-ASCII text
+    if not ('&' in text or '<' in text or '>' in text):
+        return text
+    if len(text) <= _CACHEABLE_LEN:
+        return _cached_escape_special(text)
+    return _escape_special(text)
 
 # Example usage:
 # ssml_string = '<speak>Hello, <break time="500ms"/>world!</speak>'
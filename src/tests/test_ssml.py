@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+import unittest
+import xmlrunner
+import sys
+import os
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+from ssml import parse_attributes, SSMLTag, SSMLText, parseSSML, ssmlNodeToText, escapeXMLChars, unescapeXMLChars
+from ssml import _CACHEABLE_LEN, _cached_escape_special, _cached_unescape_entities
+
+
+class TestXMLEscaping(unittest.TestCase):
+    def test_escape_special_chars(self):
+        self.assertEqual(escapeXMLChars("<"), "&lt;")
+        self.assertEqual(escapeXMLChars(">"), "&gt;")
+        self.assertEqual(escapeXMLChars("&"), "&amp;")
+        self.assertEqual(escapeXMLChars("a < b & c > d"), "a &lt; b &amp; c &gt; d")
+
+    def test_escape_plain_text(self):
+        self.assertEqual(escapeXMLChars("Hello, world!"), "Hello, world!")
+        self.assertEqual(escapeXMLChars(""), "")
+
+    def test_unescape_entities(self):
+        self.assertEqual(unescapeXMLChars("&lt;&gt;&amp;"), "<>&")
+        self.assertEqual(unescapeXMLChars("&amp;lt;"), "&lt;")
+        self.assertEqual(unescapeXMLChars("Hello, world!"), "Hello, world!")
+
+    def test_escape_round_trip(self):
+        for text in ["<", "a < b & c > d", "&lt;", "Tom & Jerry", "x" * 100 + "<&>" * 50]:
+            self.assertEqual(unescapeXMLChars(escapeXMLChars(text)), text)
+
+    def test_long_text_skips_cache(self):
+        text = "a < b & c > d " * 10
+        escaped = "a &lt; b &amp; c &gt; d " * 10
+        self.assertGreater(len(text), _CACHEABLE_LEN)
+        escape_size = _cached_escape_special.cache_info().currsize
+        unescape_size = _cached_unescape_entities.cache_info().currsize
+        self.assertEqual(escapeXMLChars(text), escaped)
+        self.assertEqual(unescapeXMLChars(escaped), text)
+        self.assertEqual(_cached_escape_special.cache_info().currsize, escape_size)
+        self.assertEqual(_cached_unescape_entities.cache_info().currsize, unescape_size)
+
+    def test_text_node_round_trip(self):
+        ssml = "<speak>a &lt; b &amp; c &gt; d</speak>"
+        parsed = parseSSML(ssml)
+        self.assertEqual(parsed, SSMLTag("speak", {}, [SSMLText("a < b & c > d")]))
+        self.assertEqual(ssmlNodeToText(parsed), ssml)
+
+    def test_attribute_value_escaping(self):
+        node = SSMLTag("voice", {"name": "a<b&c"}, [SSMLText("x")])
+        self.assertEqual(ssmlNodeToText(node), '<voice name="a&lt;b&amp;c">x</voice>')
+
+
+class TestParseAttributes(unittest.TestCase):
+    def assertAttributeError(self, attr_string, message):
+        with self.assertRaises(Exception) as ctx:
+            parse_attributes(attr_string)
+        self.assertEqual(str(ctx.exception), message)
+
+    def test_quoted_values(self):
+        self.assertEqual(parse_attributes('time="500ms"'), {"time": "500ms"})
+        self.assertEqual(parse_attributes("pitch='+2st'"), {"pitch": "+2st"})
+        self.assertEqual(
+            parse_attributes(' rate = "slow"  xml:lang=\'en-US\' '),
+            {"rate": "slow", "xml:lang": "en-US"},
+        )
+
+    def test_unquoted_value(self):
+        self.assertEqual(parse_attributes("time=500ms level=strong"), {"time": "500ms", "level": "strong"})
+
+    def test_entities_in_quoted_values(self):
+        self.assertEqual(parse_attributes('name="a&amp;b"'), {"name": "a&amp;b"})
+        # A quote inside an entity does not end the value
+        self.assertEqual(parse_attributes('name="a&q"uot;b"'), {"name": 'a&q"uot;b'})
+
+    def test_invalid_attribute_name(self):
+        self.assertAttributeError('!x="1"', "Invalid attribute at position 0")
+        self.assertAttributeError("x=>", "Invalid attribute at position 2")
+
+    def test_missing_equals(self):
+        self.assertAttributeError('x="1" y', "Expected '=' after attribute name 'y'")
+
+    def test_missing_value(self):
+        self.assertAttributeError("x = ", "Expected attribute value after '=' for attribute 'x'")
+
+    def test_unclosed_quote(self):
+        self.assertAttributeError('x="abc', "Unclosed quote in attribute value for 'x'")
+        self.assertAttributeError("x='abc", "Unclosed quote in attribute value for 'x'")
+        self.assertAttributeError('x="&amp', "Unclosed quote in attribute value for 'x'")
+
+    def test_long_malformed_attribute_fails_fast(self):
+        # A failed match must not be retried at every later offset
+        start = time.perf_counter()
+        for attr_string in ["a" + "x" * 32000, 'a="' + "x" * 32000, 'a="&' + "x" * 32000]:
+            with self.assertRaises(Exception):
+                parse_attributes(attr_string)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+class TestSpeakRootTag(unittest.TestCase):
+    def test_speak_case_insensitive(self):
+        self.assertEqual(parseSSML(" <SPEAK>hi</Speak> "), SSMLTag("speak", {}, [SSMLText("hi")]))
+
+    def test_speak_prefixed_tag_name_rejected(self):
+        with self.assertRaises(Exception):
+            parseSSML("<speakx>a</speak>")
+
+    def test_speak_tag_name_with_name_chars_rejected(self):
+        for ssml in ["<speak-x>a</speak>", "<speak:x>a</speak>", "<speak.x>a</speak>"]:
+            with self.assertRaises(Exception) as ctx:
+                parseSSML(ssml)
+            self.assertEqual(str(ctx.exception), "SSML must be wrapped in a <speak> tag")
+
+    def test_speak_closing_tag_with_whitespace(self):
+        self.assertEqual(parseSSML("<speak>x</speak >"), SSMLTag("speak", {}, [SSMLText("x")]))
+
+    def test_text_after_closing_speak_rejected(self):
+        with self.assertRaises(Exception):
+            parseSSML("<speak></speak>trailing")
+
+    def test_speak_attributes_separated_by_tab(self):
+        self.assertEqual(
+            parseSSML('<speak\tversion="1.0">a</speak>'),
+            SSMLTag("speak", {"version": "1.0"}, [SSMLText("a")]),
+        )
+
+    def test_missing_speak_tag(self):
+        with self.assertRaises(Exception):
+            parseSSML("hello")
+        with self.assertRaises(Exception):
+            parseSSML("<speak>hello")
+
+
+class TestSelfClosingTags(unittest.TestCase):
+    def test_self_closing_tag(self):
+        self.assertEqual(
+            parseSSML('<speak>a<break time="1s" />b</speak>'),
+            SSMLTag("speak", {}, [SSMLText("a"), SSMLTag("break", {"time": "1s"}), SSMLText("b")]),
+        )
+
+    def test_self_closing_tag_with_unicode_whitespace(self):
+        self.assertEqual(
+            parseSSML("<speak><p/\xa0>b</speak>"),
+            SSMLTag("speak", {}, [SSMLTag("p"), SSMLText("b")]),
+        )
+
+    def test_only_one_slash_is_stripped(self):
+        self.assertEqual(parseSSML("<speak><b//></speak>"), SSMLTag("speak", {}, [SSMLTag("b/")]))
+
+
+class TestNesting(unittest.TestCase):
+    def test_deeply_nested_tags_round_trip(self):
+        # Compare strings rather than trees: SSMLTag.__eq__ recurses per level
+        depth = 5000
+        ssml = "<speak>" + "<p>" * depth + "x" + "</p>" * depth + "</speak>"
+        self.assertEqual(ssmlNodeToText(parseSSML(ssml)), ssml)
+
+
+if __name__ == "__main__":
+    if os.getenv('CI'):
+        os.makedirs('test-reports', exist_ok=True)
+        xml_output = 'test-reports/ssml.xml'
+        with open(xml_output, 'wb') as output:
+            unittest.main(
+                testRunner=xmlrunner.XMLTestRunner(output=output, verbosity=2) ,exit=False, failfast=False, buffer=False, catchbreak=False
+            )
+        sys.exit(0)
+    else:
+        unittest.main()
+        sys.exit(0)